@@ -1,14 +1,22 @@
 import os
 import re
-import time
 import ssl
+import json
+import time
+import random
+import asyncio
+import sqlite3
+import hashlib
 import smtplib
-from datetime import datetime
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 
-import requests
+import aiohttp
 from email.message import EmailMessage
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
 
 
@@ -23,19 +31,36 @@ EMAIL_RECEIVER = os.getenv("EMAIL_RECEIVER")
 LOCATION = "United States"
 
 # You said you mainly want Food Safety Supervisor roles
+# (FSQA is covered by the keyword group in build_queries, not a separate role)
 ROLE_KEYWORDS = [
     "Food Safety Supervisor",
-    "Food Safety Supervisor FSQA",  # helps some searches
 ]
 
+# Roughly most-common first, so a match usually stops the scan early
 FOOD_HINTS = [
-    "food", "foods", "food manufacturing", "food processing", "plant", "production",
-    "warehouse", "haccp", "sqf", "fsqa", "gmp", "sanitation", "usda", "fda",
+    "food", "foods", "food manufacturing", "food processing", "production", "plant",
+    "sanitation", "haccp", "gmp", "sqf", "fda", "usda", "fsqa", "warehouse",
     "meat", "poultry", "dairy", "bakery", "beverage", "produce"
 ]
+# Hints that contain a shorter hint ("foods" has "food") can never decide a match
+_FOOD_SCAN = tuple(h for h in FOOD_HINTS if not any(o != h and o in h for o in FOOD_HINTS))
+
+_HOUR_RE = re.compile(r"(\d+)\s+hour")
+_DAY_RE = re.compile(r"(\d+)\s+day")
+_WEEK_RE = re.compile(r"(\d+)\s+week")
+
+LINK_FONT = Font(color="0000FF", underline="single")
 
 # Only these sources
 ALLOWED_SOURCES = {"indeed", "linkedin", "glassdoor", "ziprecruiter"}
+_SRC_CANON = {
+    "indeed": "Indeed",
+    "linkedin": "LinkedIn",
+    "glassdoor": "Glassdoor",
+    "ziprecruiter": "ZipRecruiter",
+}
+# One scan finds the source and tells us which one it is
+_SRC_RE = re.compile("|".join(sorted(ALLOWED_SOURCES)), re.IGNORECASE)
 
 
 def validate_env():
@@ -45,62 +70,221 @@ def validate_env():
         raise ValueError("EMAIL_SENDER / EMAIL_PASSWORD / EMAIL_RECEIVER missing (GitHub Secrets).")
 
 
-# ---------------- SerpAPI calls (retry/backoff) ----------------
-def serpapi_google_jobs(query: str, location: str, num: int = 50) -> List[Dict[str, Any]]:
+# ---------------- On-disk response cache ----------------
+# Persisted between GitHub Actions runs (see daily_jobs.yml). The cron runs
+# every 24h, so only listings are reused across days; searches expire first
+# (new postings must show up) and only help manual re-runs on the same day.
+CACHE_PATH = os.getenv("SERPAPI_CACHE", "serpapi_cache.sqlite")
+SEARCH_CACHE_TTL = 6 * 60 * 60          # search results change during the day
+LISTING_CACHE_TTL = 7 * 24 * 60 * 60    # listings rarely change
+
+_cache_db = None
+
+
+def _cache() -> sqlite3.Connection:
+    global _cache_db
+    if _cache_db is None:
+        _cache_db = sqlite3.connect(CACHE_PATH)
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, saved_at REAL, body TEXT)"
+        )
+        # Drop anything no TTL can use anymore so the file doesn't grow forever
+        _cache_db.execute(
+            "DELETE FROM responses WHERE saved_at < ?", (time.time() - LISTING_CACHE_TTL,)
+        )
+        _cache_db.commit()
+    return _cache_db
+
+
+def cache_key(params: Dict[str, Any]) -> str:
+    # api_key is left out so rotating the secret doesn't invalidate the cache
+    items = sorted((k, str(v)) for k, v in params.items() if k != "api_key")
+    return hashlib.sha1(json.dumps(items).encode("utf-8")).hexdigest()
+
+
+def cache_get(params: Dict[str, Any], ttl: int) -> Any:
+    row = _cache().execute(
+        "SELECT saved_at, body FROM responses WHERE key = ?", (cache_key(params),)
+    ).fetchone()
+    if not row or time.time() - row[0] > ttl:
+        return None
+    return json.loads(row[1])
+
+
+def cache_put(params: Dict[str, Any], data: Any):
+    db = _cache()
+    db.execute(
+        "INSERT OR REPLACE INTO responses (key, saved_at, body) VALUES (?, ?, ?)",
+        (cache_key(params), time.time(), json.dumps(data)),
+    )
+    db.commit()
+
+
+# ---------------- SerpAPI calls (async, retry/backoff) ----------------
+SERPAPI_URL = "https://serpapi.com/search"
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# SerpAPI free-tier safe: at most 8 requests in flight
+MAX_CONCURRENCY = 8
+
+# Credit/latency trade-off: each page costs a SerpAPI credit and waits for the
+# previous page's token, so fetch at most 2 pages (~20 results) per query
+PAGES_PER_QUERY = 2
+
+BACKOFF_BASE = 0.5      # seconds
+BACKOFF_CAP = 30        # seconds
+BACKOFF_JITTER = 0.5    # seconds
+RETRY_AFTER_CAP = 60    # never trust a Retry-After longer than this
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Server's Retry-After if it sent a positive one, else capped exponential backoff with jitter."""
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = 0.0  # HTTP-date form; fall back to our own backoff
+        # 0 or negative would mean retrying immediately with no jitter
+        if seconds > 0:
+            return min(RETRY_AFTER_CAP, seconds)
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) + random.uniform(0, BACKOFF_JITTER)
+
+
+async def _request_with_retry(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    params: Dict[str, Any],
+    max_attempts: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    GET SerpAPI with retries on 429/5xx and network errors.
+    Returns the JSON body, or None if the request failed for good.
+    """
+    for attempt in range(max_attempts):
+        retry_after = None
+        try:
+            async with sem:
+                async with session.get(SERPAPI_URL, params=params) as r:
+                    if r.status == 200:
+                        return await r.json(content_type=None) or {}
+                    if r.status not in RETRY_STATUSES:
+                        return None
+                    retry_after = r.headers.get("Retry-After")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+
+        # Back off outside the semaphore so other requests can proceed
+        if attempt < max_attempts - 1:
+            await asyncio.sleep(_retry_delay(attempt, retry_after))
+
+    return None
+
+
+async def _search_page(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    params: Dict[str, Any],
+) -> Dict[str, Any]:
+    """One page of google_jobs results: {"jobs": [...], "next_page_token": str or None}."""
+    cached = cache_get(params, SEARCH_CACHE_TTL)
+    if isinstance(cached, dict):
+        return cached
+
+    data = await _request_with_retry(session, sem, params, max_attempts=5)
+    if data is None:
+        return {"jobs": [], "next_page_token": None}
+
+    page = {
+        "jobs": data.get("jobs_results", []) or [],
+        "next_page_token": (data.get("serpapi_pagination") or {}).get("next_page_token"),
+    }
+    cache_put(params, page)
+    return page
+
+
+async def serpapi_google_jobs_async(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    query: str,
+    location: str,
+    max_pages: int = PAGES_PER_QUERY,
+) -> List[Dict[str, Any]]:
+    """
+    Google Jobs returns ~10 results per request, so follow next_page_token
+    for up to max_pages pages. Pages of one query are fetched in order
+    (each needs the previous token); different queries still run concurrently.
+    """
     params = {
         "engine": "google_jobs",
         "q": query,
         "location": location,
         "api_key": SERPAPI_KEY,
-        "num": num,
     }
 
-    retry_statuses = {429, 502, 503, 504}
-    max_attempts = 5
-
-    for attempt in range(1, max_attempts + 1):
-        try:
-            r = requests.get("https://serpapi.com/search", params=params, timeout=30)
-
-            if r.status_code in retry_statuses:
-                time.sleep(2 ** attempt)
-                continue
-
-            r.raise_for_status()
-            data = r.json()
-            return data.get("jobs_results", []) or []
+    jobs = []
+    for _ in range(max_pages):
+        page = await _search_page(session, sem, params)
+        jobs.extend(page["jobs"])
 
-        except requests.RequestException:
-            time.sleep(2 ** attempt)
+        token = page["next_page_token"]
+        if not token or not page["jobs"]:
+            break
+        params = {**params, "next_page_token": token}
 
-    return []
+    return jobs
 
 
-def serpapi_google_jobs_listing(job_id: str) -> Dict[str, Any]:
+async def serpapi_google_jobs_listing_async(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    job_id: str,
+) -> Dict[str, Any]:
     if not job_id:
         return {}
 
     params = {"engine": "google_jobs_listing", "job_id": job_id, "api_key": SERPAPI_KEY}
-    retry_statuses = {429, 502, 503, 504}
-    max_attempts = 4
 
-    for attempt in range(1, max_attempts + 1):
-        try:
-            r = requests.get("https://serpapi.com/search", params=params, timeout=30)
+    cached = cache_get(params, LISTING_CACHE_TTL)
+    if cached is not None:
+        return _listing_from_cache(cached)
+
+    details = await _request_with_retry(session, sem, params, max_attempts=4) or {}
+    if details:
+        to_cache = _listing_for_cache(details)
+        if to_cache is not None:
+            cache_put(params, to_cache)
+    return details
+
 
-            if r.status_code in retry_statuses:
-                time.sleep(2 ** attempt)
-                continue
+def _listing_for_cache(details: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    posted_at is relative ("3 days ago") and goes stale while cached, so store
+    the absolute posted date instead and rebuild posted_at on read.
+    Returns None (don't cache) if posted_at can't be turned into a date.
+    """
+    de = details.get("detected_extensions")
+    if not isinstance(de, dict) or "posted_at" not in de:
+        return details
 
-            if r.status_code != 200:
-                return {}
+    de = dict(de)
+    days = posted_days(str(de.pop("posted_at") or ""))
+    if days == 999:
+        return None
 
-            return r.json() or {}
+    de["posted_date"] = (date.today() - timedelta(days=days)).isoformat()
+    return {**details, "detected_extensions": de}
 
-        except requests.RequestException:
-            time.sleep(2 ** attempt)
 
-    return {}
+def _listing_from_cache(cached: Dict[str, Any]) -> Dict[str, Any]:
+    de = cached.get("detected_extensions")
+    if not isinstance(de, dict) or "posted_date" not in de:
+        return cached
+
+    de = dict(de)
+    days = (date.today() - date.fromisoformat(de.pop("posted_date"))).days
+    de["posted_at"] = "today" if days <= 0 else f"{days} day{'s' if days > 1 else ''} ago"
+    return {**cached, "detected_extensions": de}
 
 
 # ---------------- Helpers ----------------
@@ -109,29 +293,30 @@ def normalize_source(via_value: str) -> str:
     SerpAPI google_jobs returns "via": "Indeed", "LinkedIn", "ZipRecruiter", etc.
     We'll normalize and filter to only 4 sources.
     """
-    s = (via_value or "").strip().lower()
-    if "indeed" in s:
-        return "Indeed"
-    if "linkedin" in s:
-        return "LinkedIn"
-    if "glassdoor" in s:
-        return "Glassdoor"
-    if "ziprecruiter" in s:
-        return "ZipRecruiter"
-    return ""
+    m = _SRC_RE.search(via_value or "")
+    return _SRC_CANON[m.group(0).lower()] if m else ""
 
 
-def is_allowed_source(via_value: str) -> bool:
-    s = (via_value or "").lower()
-    return any(x in s for x in ALLOWED_SOURCES)
+def _first_http_link(items: Any) -> str:
+    if isinstance(items, list):
+        for item in items:
+            link = (item.get("link") or "") if isinstance(item, dict) else ""
+            if link.startswith("http"):
+                return link
+    return ""
 
 
 def safe_apply_link(job: Dict[str, Any]) -> str:
-    links = job.get("related_links") or []
-    if isinstance(links, list) and links:
-        link = links[0].get("link") or ""
-        return link if link.startswith("http") else "N/A"
-    return "N/A"
+    """
+    Best apply link available in the search result itself, so we only need the
+    listing details call when none of these are present.
+    """
+    link = _first_http_link(job.get("related_links")) or _first_http_link(job.get("apply_options"))
+    if link:
+        return link
+
+    share_link = job.get("share_link") or ""
+    return share_link if share_link.startswith("http") else "N/A"
 
 
 def safe_apply_link_from_details(details: Dict[str, Any]) -> str:
@@ -142,16 +327,34 @@ def safe_apply_link_from_details(details: Dict[str, Any]) -> str:
     return "N/A"
 
 
-def safe_pay(job: Dict[str, Any]) -> str:
+def _prepare_view(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Pull out the fields the per-job helpers read, once per job:
+    lowercased title/company/description text, extensions as (original, lowercased)
+    pairs, and detected_extensions. Pass the result to looks_food_industry,
+    safe_pay and safe_time_posted.
+    """
+    ext = job.get("extensions") or []
     de = job.get("detected_extensions") or {}
-    if isinstance(de, dict) and de.get("salary"):
+    return {
+        "text_lc": " ".join([
+            str(job.get("title") or ""),
+            str(job.get("company_name") or ""),
+            str(job.get("description") or ""),
+        ]).lower(),
+        "ext": [(item, item.lower()) for item in ext if isinstance(item, str)] if isinstance(ext, list) else [],
+        "de": de if isinstance(de, dict) else {},
+    }
+
+
+def safe_pay(view: Dict[str, Any]) -> str:
+    de = view["de"]
+    if de.get("salary"):
         return str(de["salary"])
 
-    ext = job.get("extensions") or []
-    if isinstance(ext, list):
-        for item in ext:
-            if isinstance(item, str) and ("$" in item or "hour" in item.lower() or "year" in item.lower()):
-                return item
+    for item, item_lc in view["ext"]:
+        if "$" in item or "hour" in item_lc or "year" in item_lc:
+            return item
     return "N/A"
 
 
@@ -162,19 +365,14 @@ def safe_pay_from_details(details: Dict[str, Any]) -> str:
     return "N/A"
 
 
-def safe_time_posted(job: Dict[str, Any]) -> str:
-    de = job.get("detected_extensions") or {}
-    if isinstance(de, dict) and de.get("posted_at"):
+def safe_time_posted(view: Dict[str, Any]) -> str:
+    de = view["de"]
+    if de.get("posted_at"):
         return str(de["posted_at"])
 
-    ext = job.get("extensions") or []
-    if isinstance(ext, list):
-        for item in ext:
-            if isinstance(item, str) and (
-                "ago" in item.lower() or "today" in item.lower() or
-                "yesterday" in item.lower() or "posted" in item.lower()
-            ):
-                return item
+    for item, item_lc in view["ext"]:
+        if "ago" in item_lc or "today" in item_lc or "yesterday" in item_lc or "posted" in item_lc:
+            return item
     return "N/A"
 
 
@@ -185,6 +383,7 @@ def safe_time_posted_from_details(details: Dict[str, Any]) -> str:
     return "N/A"
 
 
+@lru_cache(maxsize=1024)
 def posted_days(time_posted: str) -> int:
     if not time_posted or time_posted == "N/A":
         return 999
@@ -195,87 +394,132 @@ def posted_days(time_posted: str) -> int:
     if "yesterday" in s:
         return 1
 
-    m = re.search(r"(\d+)\s+hour", s)
+    m = _HOUR_RE.search(s)
     if m:
         return 0
 
-    m = re.search(r"(\d+)\s+day", s)
+    m = _DAY_RE.search(s)
     if m:
         return int(m.group(1))
 
-    m = re.search(r"(\d+)\s+week", s)
+    m = _WEEK_RE.search(s)
     if m:
         return int(m.group(1)) * 7
 
     return 999
 
 
-def looks_food_industry(job: Dict[str, Any]) -> bool:
-    text = " ".join([
-        str(job.get("title") or ""),
-        str(job.get("company_name") or ""),
-        str(job.get("description") or ""),
-    ]).lower()
-    return any(h in text for h in FOOD_HINTS)
-
-
-def normalize_row(job: Dict[str, Any]) -> Dict[str, str]:
+def looks_food_industry(view: Dict[str, Any]) -> bool:
+    text_lc = view["text_lc"]
+    return any(h in text_lc for h in _FOOD_SCAN)
+
+
+@dataclass(slots=True)
+class JobRow:
+    job_id: str  # dedupe only
+    title: str
+    company_name: str
+    pay: str
+    time_posted: str
+    location: str
+    source: str
+    link: str
+    days: int = 999  # parsed from time_posted, see main_async
+
+
+# Excel header (EXACT column names requested) -> JobRow attribute, in column order
+_COLS = (
+    ("title", "title"),
+    ("company name", "company_name"),
+    ("pay", "pay"),
+    ("time posted", "time_posted"),
+    ("location", "location"),
+    ("source", "source"),
+    ("link to apply", "link"),
+)
+
+
+def normalize_row_shallow(
+    job: Dict[str, Any],
+    source_norm: Optional[str] = None,
+    view: Optional[Dict[str, Any]] = None,
+) -> JobRow:
+    """
+    Build a row from the search result only (no extra API call).
+    Missing fields stay "N/A" until enrich_row fills them in.
+    """
     job_id = job.get("job_id") or "N/A"
 
     title = job.get("title") or "N/A"
     company = job.get("company_name") or "N/A"
     location = job.get("location") or "N/A"
 
-    source_norm = normalize_source(job.get("via") or "")
-    pay = safe_pay(job)
-    time_posted = safe_time_posted(job)
+    if source_norm is None:
+        source_norm = normalize_source(job.get("via") or "")
+    if view is None:
+        view = _prepare_view(job)
+
+    pay = safe_pay(view)
+    time_posted = safe_time_posted(view)
     apply_link = safe_apply_link(job)
 
-    # Try details if any key field missing
-    if job_id != "N/A" and (pay == "N/A" or time_posted == "N/A" or apply_link == "N/A"):
-        details = serpapi_google_jobs_listing(job_id)
-        if details:
-            if pay == "N/A":
-                pay = safe_pay_from_details(details) or pay
-            if time_posted == "N/A":
-                time_posted = safe_time_posted_from_details(details) or time_posted
-            if apply_link == "N/A":
-                apply_link = safe_apply_link_from_details(details) or apply_link
+    return JobRow(
+        job_id=job_id,
+        title=title,
+        company_name=company,
+        pay=pay if pay else "N/A",
+        time_posted=time_posted if time_posted else "N/A",
+        location=location,
+        source=source_norm if source_norm else "N/A",
+        link=apply_link if apply_link else "N/A",
+    )
 
-    return {
-        "job_id": job_id,  # dedupe only
-        "title": title,
-        "company name": company,     # EXACT column name requested
-        "pay": pay if pay else "N/A",
-        "time posted": time_posted if time_posted else "N/A",
-        "location": location,
-        "source": source_norm if source_norm else "N/A",
-        "link to apply": apply_link if apply_link else "N/A",
-    }
+
+async def enrich_row(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    row: JobRow,
+) -> JobRow:
+    """Fill missing pay / time posted / link from the listing details API."""
+    # Everything already known from the search result: no API call needed
+    if row.pay != "N/A" and row.time_posted != "N/A" and row.link != "N/A":
+        return row
+
+    if not row.job_id or row.job_id == "N/A":
+        return row
+
+    details = await serpapi_google_jobs_listing_async(session, sem, row.job_id)
+    if details:
+        if row.pay == "N/A":
+            row.pay = safe_pay_from_details(details) or "N/A"
+        if row.time_posted == "N/A":
+            row.time_posted = safe_time_posted_from_details(details) or "N/A"
+        if row.link == "N/A":
+            row.link = safe_apply_link_from_details(details) or "N/A"
+
+    return row
 
 
 def build_queries() -> List[str]:
     """
     Focus ONLY on Food Safety Supervisor.
-    (You can add more query variations if you want more results.)
+    One query per role; Google Jobs' OR operator covers the keyword variants
+    that used to be separate searches. No bare "food" in the group: the role
+    phrase already contains it, which would make the whole group always true.
     """
-    queries = []
-    for role in ROLE_KEYWORDS:
-        queries.append(f'"{role}" food')
-        queries.append(f'"{role}" HACCP')
-        queries.append(f'"{role}" SQF')
-        queries.append(f'"{role}" FSQA')
-        queries.append(f'"{role}" GMP')
-        queries.append(f'"{role}" food manufacturing')
-        queries.append(f'"{role}" food processing')
-    return queries
-
-
-def dedupe(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    terms = '(HACCP OR SQF OR FSQA OR GMP OR "food manufacturing" OR "food processing")'
+    queries = [f'"{role}" {terms}' for role in ROLE_KEYWORDS]
+    return list(dict.fromkeys(queries))  # drop exact duplicates, keep order
+
+
+def dedupe(rows: List[JobRow]) -> List[JobRow]:
     seen = set()
     out = []
     for r in rows:
-        key = r.get("job_id") or (r.get("title","") + "|" + r.get("company name","") + "|" + r.get("location",""))
+        if r.job_id and r.job_id != "N/A":
+            key = r.job_id
+        else:
+            key = r.title + "|" + r.company_name + "|" + r.location
         if key in seen:
             continue
         seen.add(key)
@@ -283,27 +527,26 @@ def dedupe(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
     return out
 
 
-def create_excel(rows: List[Dict[str, str]], filename: str) -> str:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Jobs"
+def create_excel(rows: List[JobRow], filename: str) -> str:
+    # write_only streams rows to disk instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Jobs")
 
     # EXACT order requested
-    headers = ["title", "company name", "pay", "time posted", "location", "source", "link to apply"]
+    headers = [h for h, _ in _COLS]
+    attrs = [a for _, a in _COLS]
     ws.append(headers)
 
-    # Write rows
+    # Write rows, making "link to apply" clickable as we go
+    link_idx = attrs.index("link")
     for r in rows:
-        ws.append([r.get(h, "N/A") for h in headers])
-
-    # Make "link to apply" clickable
-    link_col = headers.index("link to apply") + 1
-    for row_idx in range(2, ws.max_row + 1):
-        cell = ws.cell(row=row_idx, column=link_col)
-        val = str(cell.value or "")
+        cells = [WriteOnlyCell(ws, value=getattr(r, a)) for a in attrs]
+        link = cells[link_idx]
+        val = str(link.value or "")
         if val.startswith("http"):
-            cell.hyperlink = val
-            cell.font = Font(color="0000FF", underline="single")
+            link.hyperlink = val
+            link.font = LINK_FONT
+        ws.append(cells)
 
     wb.save(filename)
     return filename
@@ -332,32 +575,67 @@ def send_email_with_attachment(subject: str, body: str, attachment_path: str):
         server.send_message(msg)
 
 
-def main():
-    validate_env()
+async def collect_rows() -> List[JobRow]:
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    # One session/connector for every search and listing call so TCP/TLS is reused
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=30)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # Fan out all searches at once; latency overlaps instead of adding up
+        results = await asyncio.gather(*[
+            serpapi_google_jobs_async(session, sem, q, LOCATION)
+            for q in build_queries()
+        ])
 
-    all_rows: List[Dict[str, str]] = []
+        rows = []
+        seen_ids = set()
+        for jobs in results:
+            for job in jobs:
+                # Queries overlap a lot; drop repeats before any other work
+                jid = job.get("job_id")
+                if jid:
+                    if jid in seen_ids:
+                        continue
+                    seen_ids.add(jid)
 
-    for q in build_queries():
-        jobs = serpapi_google_jobs(q, LOCATION, num=50)
+                # Must be from only 4 sources
+                source_norm = normalize_source(job.get("via") or "")
+                if not source_norm:
+                    continue
 
-        for job in jobs:
-            # Must be from only 4 sources
-            if not is_allowed_source(job.get("via") or ""):
-                continue
+                # Must look like food industry
+                view = _prepare_view(job)
+                if not looks_food_industry(view):
+                    continue
 
-            # Must look like food industry
-            if not looks_food_industry(job):
-                continue
+                rows.append(normalize_row_shallow(job, source_norm, view))
 
-            all_rows.append(normalize_row(job))
+        # job_id repeats are gone already; this catches rows without one
+        rows = dedupe(rows)
 
-    all_rows = dedupe(all_rows)
+        # Drop rows already known to be older than 7 days before paying for details.
+        # Rows with unknown time posted are kept so enrichment can fill it in.
+        rows = [r for r in rows if r.time_posted == "N/A" or posted_days(r.time_posted) <= 7]
+
+        # Detail lookups (only fired for rows with missing fields) run concurrently
+        return list(await asyncio.gather(*[enrich_row(session, sem, r) for r in rows]))
+
+
+async def main_async():
+    validate_env()
+
+    all_rows = await collect_rows()
+
+    # Parse "time posted" once per row; used for both filter and sort
+    for r in all_rows:
+        r.days = posted_days(r.time_posted)
 
     # Keep last 7 days
-    all_rows = [r for r in all_rows if posted_days(r.get("time posted", "N/A")) <= 7]
+    all_rows = [r for r in all_rows if r.days <= 7]
 
     # Sort newest first (0 days first)
-    all_rows.sort(key=lambda r: posted_days(r.get("time posted", "N/A")))
+    all_rows.sort(key=lambda r: r.days)
 
     today = datetime.now().strftime("%Y-%m-%d")
     excel_file = f"ajay_jobs_{today}.xlsx"  # name can be anything
@@ -381,5 +659,15 @@ Job Bot
     send_email_with_attachment(subject, body, excel_file)
 
 
+def main():
+    # uvloop is optional (not available on Windows); default loop works fine too
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main_async())
+    else:
+        uvloop.run(main_async())
+
+
 if __name__ == "__main__":
     main()